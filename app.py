@@ -1,4 +1,6 @@
 import os
+import threading
+from collections import OrderedDict
 import streamlit as st
 from dotenv import load_dotenv
 from pinecone import Pinecone
@@ -12,32 +14,106 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 PINECONE_INDEX_NAME = "your-index-name"  # Replace with your actual index name
 PINECONE_NAMESPACE = "your-namespace"  # Replace with your actual namespace
 
-# Initialize Pinecone and OpenAI
-pc = Pinecone(api_key=PINECONE_API_KEY)
-index = pc.Index(PINECONE_INDEX_NAME)
-embeddings = OpenAIEmbeddings(openai_api_key=OPENAI_API_KEY) # type: ignore
-vectorstore = PineconeVectorStore(
-    index=index,
-    embedding=embeddings,
-    namespace=PINECONE_NAMESPACE,
-    text_key="text"
-)
-llm = ChatOpenAI(openai_api_key=OPENAI_API_KEY, # type: ignore
-                    model="gpt-4o",
-                )
-
-# Streamlit UI
-st.title("Chat with your Pinecone Data (OpenAI Agent)")
-query = st.text_input("Ask a question about your documents:")
-
-if query:
-    # Retrieve relevant docs from Pinecone
-    docs = vectorstore.similarity_search(query, k=700)
+TOP_K_RESULTS = 20  # Number of chunks retrieved per question
+ANSWER_CACHE_SIZE = 256  # Number of answers kept in memory
+
+
+class AnswerCache:
+    """Thread-safe LRU cache of answers keyed by (query, namespace)."""
+
+    def __init__(self, max_entries=ANSWER_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(query, namespace):
+        return (" ".join(query.split()).lower(), namespace)
+
+    def get(self, query, namespace):
+        key = self.key(query, namespace)
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, query, namespace, answer):
+        key = self.key(query, namespace)
+        with self._lock:
+            self._entries[key] = answer
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# Shared across every rerun and browser session of this Streamlit process
+@st.cache_resource
+def get_vectorstore(namespace=PINECONE_NAMESPACE):
+    pc = Pinecone(api_key=PINECONE_API_KEY)
+    index = pc.Index(PINECONE_INDEX_NAME)
+    embeddings = OpenAIEmbeddings(openai_api_key=OPENAI_API_KEY) # type: ignore
+    return PineconeVectorStore(
+        index=index,
+        embedding=embeddings,
+        namespace=namespace,
+        text_key="text"
+    )
+
+
+@st.cache_resource
+def get_llm():
+    return ChatOpenAI(openai_api_key=OPENAI_API_KEY, # type: ignore
+                        model="gpt-4o",
+                        streaming=True,
+                    )
+
+
+@st.cache_resource
+def get_answer_cache():
+    return AnswerCache()
+
+
+def build_prompt(query, docs):
     context = "\n\n".join([doc.page_content for doc in docs])
+    return f"Answer the question based on the following context:\n{context}\n\nQuestion: {query}"
+
+
+def stream_answer(query, vectorstore, llm, cache, namespace=PINECONE_NAMESPACE, k=TOP_K_RESULTS):
+    """Yield the answer as text chunks, serving repeated questions from the cache."""
+    cached = cache.get(query, namespace)
+    if cached is not None:
+        yield cached
+        return
+
+    # Retrieve relevant docs from Pinecone
+    docs = vectorstore.similarity_search(query, k=k)
+    prompt = build_prompt(query, docs)
+
+    # Stream the answer from OpenAI, caching it only once it is complete
+    parts = []
+    for chunk in llm.stream(prompt):
+        if chunk.content:
+            parts.append(chunk.content)
+            yield chunk.content
+    cache.put(query, namespace, "".join(parts))
+
+
+def main():
+    # Streamlit UI
+    st.title("Chat with your Pinecone Data (OpenAI Agent)")
+    query = st.text_input("Ask a question about your documents:")
+
+    if query:
+        st.write("**Answer:**")
+        st.write_stream(stream_answer(
+            query,
+            vectorstore=get_vectorstore(PINECONE_NAMESPACE),
+            llm=get_llm(),
+            cache=get_answer_cache(),
+            namespace=PINECONE_NAMESPACE,
+        ))
 
-    # Compose prompt for OpenAI
-    prompt = f"Answer the question based on the following context:\n{context}\n\nQuestion: {query}"
 
-    # Get answer from OpenAI
-    response = llm.invoke(prompt)
-    st.write("**Answer:**", response.content)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
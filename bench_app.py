@@ -0,0 +1,91 @@
+import time
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+from app import AnswerCache, stream_answer
+
+# --- Stand-in backend settings ---
+RETRIEVAL_LATENCY = 0.15  # Seconds per similarity search
+FIRST_TOKEN_LATENCY = 0.30  # Seconds before the model emits its first token
+TOKEN_LATENCY = 0.01  # Seconds between streamed tokens
+ANSWER_TOKENS = 50  # Tokens per answer
+
+NUM_QUESTIONS = 20  # Distinct questions
+NUM_REQUESTS = 200  # Total requests across all sessions
+NUM_SESSIONS = 16  # Simultaneous browser sessions
+NAMESPACE = "bench-namespace"
+
+
+class FakeDoc:
+    def __init__(self, text):
+        self.page_content = text
+        self.metadata = {}
+
+
+class FakeChunk:
+    def __init__(self, content):
+        self.content = content
+
+
+class FakeVectorStore:
+    def similarity_search(self, query, k=4):
+        time.sleep(RETRIEVAL_LATENCY)
+        return [FakeDoc(f"Chunk {i} about {query}") for i in range(k)]
+
+
+class FakeLLM:
+    def stream(self, prompt):
+        time.sleep(FIRST_TOKEN_LATENCY)
+        for i in range(ANSWER_TOKENS):
+            if i:
+                time.sleep(TOKEN_LATENCY)
+            yield FakeChunk(f"token{i} ")
+
+
+def run_query(query, vectorstore, llm, cache):
+    """Return (time to first token, total time) for one question."""
+    start = time.perf_counter()
+    first_token = None
+    for _ in stream_answer(query, vectorstore, llm, cache, namespace=NAMESPACE):
+        if first_token is None:
+            first_token = time.perf_counter() - start
+    return first_token, time.perf_counter() - start
+
+
+def report(label, results, elapsed):
+    ttft = sorted(r[0] for r in results)
+    p95 = ttft[int(len(ttft) * 0.95) - 1]
+    print(f"{label}: {len(results)} queries in {elapsed:.2f}s "
+          f"({len(results) / elapsed:.1f} queries/s), "
+          f"TTFT median {statistics.median(ttft) * 1000:.0f} ms, p95 {p95 * 1000:.0f} ms")
+
+
+def main():
+    vectorstore = FakeVectorStore()
+    llm = FakeLLM()
+    cache = AnswerCache()
+    questions = [f"What does section {i} say?" for i in range(NUM_QUESTIONS)]
+
+    # Cold: every question misses the cache, one session at a time
+    start = time.perf_counter()
+    cold = [run_query(q, vectorstore, llm, cache) for q in questions]
+    report("Cold (uncached, sequential)", cold, time.perf_counter() - start)
+
+    # Warm: many sessions share the same resources and answer cache
+    workload = [questions[i % NUM_QUESTIONS] for i in range(NUM_REQUESTS)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=NUM_SESSIONS) as pool:
+        warm = list(pool.map(lambda q: run_query(q, vectorstore, llm, cache), workload))
+    report(f"Warm (cached, {NUM_SESSIONS} sessions)", warm, time.perf_counter() - start)
+
+    # Concurrent misses: fresh cache, all sessions streaming from the backend
+    cache = AnswerCache()
+    workload = [f"Uncached question {i}" for i in range(NUM_SESSIONS * 4)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=NUM_SESSIONS) as pool:
+        misses = list(pool.map(lambda q: run_query(q, vectorstore, llm, cache), workload))
+    report(f"Uncached ({NUM_SESSIONS} sessions)", misses, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()